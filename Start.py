@@ -1,27 +1,52 @@
 #!/usr/bin/env python3
 
+import functools
 import os
+import signal
+import subprocess
 import sys
+import threading
 import time
+import lgpio
 import st7789
-from gpiozero import Button
 from PIL import Image, ImageDraw, ImageFont
 
 # --- HARDWARE & CONFIG ---
 # This script uses a minimal, hardcoded config for simplicity.
-os.environ['GPIOZERO_PIN_FACTORY'] = 'lgpio'
+GPIO_CHIP = 0
 BTN_A_PIN = 5
 BTN_B_PIN = 6
 BTN_X_PIN = 16
 BTN_Y_PIN = 24
-BOUNCE_TIME = 0.05
+BOUNCE_TIME = 0.005
+DISPLAY_ROTATION = 90
+# Core and SCHED_FIFO priority for the button and redraw threads (isolcpus=3 keeps the core free).
+RT_CPU = 3
+RT_PRIORITY = 10
+# Modules the apps import on launch; read ahead while the menu sits idle.
+PREWARM_MODULES = ("pygame", "gpiozero", "fluidsynth", "PIL.Image", "PIL.ImageDraw", "PIL.ImageFont",
+                   "numpy", "st7789", "mutagen.mp3", "orjson", "alsaaudio")
+# Dry-imports PREWARM_MODULES and prints every file that import loaded, shared libraries included.
+PREWARM_PROBE = """
+import importlib, sys
+for name in sys.argv[1:]:
+    try:
+        importlib.import_module(name)
+    except Exception:
+        pass
+paths = {getattr(m, "__file__", None) for m in list(sys.modules.values())}
+paths.update(getattr(m, "__cached__", None) for m in list(sys.modules.values()))
+with open("/proc/self/maps") as maps:
+    paths.update(line.split(None, 5)[5].strip() for line in maps if line.count(" ") >= 5 and ".so" in line)
+print("\\n".join(p for p in paths if p))
+"""
 
 class MainMenu:
     def __init__(self):
         try:
             self.display = st7789.ST7789(
                 port=0, cs=1, dc=9, backlight=13, rst=27,
-                width=240, height=240, rotation=90, spi_speed_hz=80000000
+                width=240, height=240, rotation=DISPLAY_ROTATION, spi_speed_hz=80000000
             )
             self.display.begin()
             self.width, self.height = self.display.width, self.display.height
@@ -29,13 +54,8 @@ class MainMenu:
             print(f"Display Init Error: {e}")
             sys.exit(1)
             
-        try:
-            self.btn_a = Button(BTN_A_PIN, pull_up=True, bounce_time=BOUNCE_TIME)
-            self.btn_b = Button(BTN_B_PIN, pull_up=True, bounce_time=BOUNCE_TIME)
-            self.btn_x = Button(BTN_X_PIN, pull_up=True, bounce_time=BOUNCE_TIME)
-        except Exception as e:
-            print(f"GPIO Error: {e}")
-            sys.exit(1)
+        self._dirty = threading.Event()
+        self._display_lock = threading.Lock()
 
         self.script_dir = os.path.dirname(os.path.realpath(__file__))
         
@@ -54,42 +74,222 @@ class MainMenu:
         self.options = ["Music Player", "Synthesizer", "Reboot", "Shutdown"]
         self.selection = 0
 
-    def draw_menu(self):
-        img = Image.new("RGB", (self.width, self.height), "black")
-        draw = ImageDraw.Draw(img)
-        
+        # Static menu frame; only the rows whose selection state changes are repainted.
+        self._row_boxes = [(15, 75 + i * 45, self.width - 15, min(110 + i * 45, self.height - 1)) for i in range(len(self.options))]
+        self._prev_selection = None
+
+        # Each row is rasterized and encoded to panel RGB565 once per state, and its
+        # panel window is resolved up front, so a redraw only has to send cached bytes.
+        self._row_windows = [self._panel_window(*box) for box in self._row_boxes]
+        self._row_tiles = {}
+        self._row_data = {}
+        for i in range(len(self.options)):
+            for selected, tile in enumerate(self._render_row(i)):
+                self._row_tiles[(i, bool(selected))] = tile
+                self._row_data[(i, bool(selected))] = self.display.image_to_data(tile, DISPLAY_ROTATION)
+
+        self._frame = Image.new("RGB", (self.width, self.height), "black")
+        self._draw = ImageDraw.Draw(self._frame)
+        draw = self._draw
         draw.text((30, 20), "PIRATE OS", font=self.font_lg, fill=(255, 0, 255))
         draw.line((30, 60, self.width - 30, 60), fill=(255, 0, 255), width=2)
-        
-        y = 80
-        for i, option in enumerate(self.options):
-            fill_color = "black"
-            text_color = (255, 0, 255)
-            
-            if i == self.selection:
-                # Invert colors for selection
-                fill_color = (255, 0, 255)
-                text_color = "black"
-                
-            draw.rectangle((15, y - 5, self.width - 15, y + 30), fill=fill_color)
-            draw.text((30, y), f"> {option}", font=self.font_md, fill=text_color)
-            y += 45
-            
-        self.display.display(img)
+        for i in range(len(self.options)):
+            self._paste_row(i, False)
+
+        # Armed last, so a press can't reach a handler before the menu state exists.
+        # Buttons are read straight from lgpio alerts on one chip handle;
+        # the callback debounces on edge timestamps and dispatches on the pin.
+        self.button_handlers = {
+            BTN_A_PIN: functools.partial(self.step_selection, -1),
+            BTN_X_PIN: functools.partial(self.step_selection, 1),
+            BTN_B_PIN: self.handle_selection,
+        }
+        self.button_callbacks = []
+        self._last_edge = {}
+        try:
+            self.gpio = lgpio.gpiochip_open(GPIO_CHIP)
+            for pin in (BTN_A_PIN, BTN_B_PIN, BTN_X_PIN):
+                lgpio.gpio_claim_alert(self.gpio, pin, lgpio.BOTH_EDGES, lgpio.SET_PULL_UP)
+                self.button_callbacks.append(lgpio.callback(self.gpio, pin, lgpio.BOTH_EDGES, self.on_button))
+        except Exception as e:
+            print(f"GPIO Error: {e}")
+            sys.exit(1)
+        self._tune_threads()
+
+    def _render_row(self, index):
+        """Returns the (normal, selected) tiles for a row from one glyph mask."""
+        x0, y0, x1, y1 = self._row_boxes[index]
+        size = (x1 - x0 + 1, y1 - y0 + 1)
+        mask = Image.new("L", size, 0)
+        ImageDraw.Draw(mask).text((30 - x0, 5), f"> {self.options[index]}", font=self.font_md, fill=255)
+
+        normal = Image.new("RGB", size, "black")
+        normal.paste((255, 0, 255), mask=mask)
+        # Invert colors for selection
+        selected = Image.new("RGB", size, (255, 0, 255))
+        selected.paste("black", mask=mask)
+        return normal, selected
+
+    def _paste_row(self, index, selected):
+        x0, y0, _, _ = self._row_boxes[index]
+        self._frame.paste(self._row_tiles[(index, selected)], (x0, y0))
+
+    def _panel_window(self, x0, y0, x1, y1):
+        """Maps a frame rectangle to the panel window it occupies after rotation."""
+        w, h = self.width - 1, self.height - 1
+        if DISPLAY_ROTATION == 90:
+            return y0, w - x1, y1, w - x0
+        if DISPLAY_ROTATION == 180:
+            return w - x1, h - y1, w - x0, h - y0
+        if DISPLAY_ROTATION == 270:
+            return h - y1, x0, h - y0, x1
+        return x0, y0, x1, y1
+
+    def _set_window(self, x0, y0, x1, y1):
+        """Like ST7789.set_window, but sends each command's four parameter bytes in one transfer."""
+        self.display.command(st7789.ST7789_CASET)
+        self.display.data([x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF])
+        self.display.command(st7789.ST7789_RASET)
+        self.display.data([y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF])
+        self.display.command(st7789.ST7789_RAMWR)
+
+    def _write_pixels(self, pixelbytes):
+        """Streams pixel data into the current window in as few transfers as spidev allows.
+
+        writebytes2 takes the buffer as-is (data() turns every 4 KB chunk into a
+        list of ints first) and splits it at the kernel's bufsiz, so each transfer
+        is large enough for the SPI controller to move it by DMA.
+        """
+        self.display.send([], True)  # raise D/C for data
+        self.display._spi.writebytes2(pixelbytes)
+
+    def display_frame(self):
+        self._set_window(0, 0, self.width - 1, self.height - 1)
+        self._write_pixels(self.display.image_to_data(self._frame, DISPLAY_ROTATION))
+
+    def display_rows(self, rows, selection):
+        """Sends only the given menu rows to the panel instead of the whole frame."""
+        for index in rows:
+            self._set_window(*self._row_windows[index])
+            self._write_pixels(self._row_data[(index, index == selection)])
+
+    def draw_menu(self):
+        selection = self.selection
+        with self._display_lock:
+            if self._prev_selection is None:
+                self._paste_row(selection, True)
+                self._prev_selection = selection
+                self.display_frame()
+                return
+
+            dirty = {self._prev_selection, selection}
+            self._prev_selection = selection
+            self.display_rows(dirty, selection)
+
+    def _tune_threads(self):
+        """Pins the menu to RT_CPU and moves lgpio's alert threads to SCHED_FIFO."""
+        main_tid = threading.get_native_id()
+        tids = [int(tid) for tid in os.listdir("/proc/self/task")]
+        self._default_affinity = os.sched_getaffinity(0)
+        try:
+            # Threads started later inherit the affinity from the main thread.
+            if RT_CPU in os.sched_getaffinity(0):
+                for tid in tids:
+                    os.sched_setaffinity(tid, {RT_CPU})
+            for tid in tids:
+                if tid != main_tid:
+                    os.sched_setscheduler(tid, os.SCHED_FIFO, os.sched_param(RT_PRIORITY))
+        except OSError as e:
+            print(f"Thread tuning skipped: {e}")
+
+    def _untune_thread(self):
+        """Resets this thread's affinity and policy; both survive exec into the apps."""
+        try:
+            os.sched_setaffinity(0, self._default_affinity)
+            os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+        except OSError as e:
+            print(f"Thread reset failed: {e}")
+
+    def _redraw_worker(self):
+        """Redraws off the button thread; presses during a flush share one redraw."""
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(RT_PRIORITY))
+        except OSError:
+            pass  # Already reported by _tune_threads.
+        while True:
+            self._dirty.wait()
+            self._dirty.clear()
+            self.draw_menu()
+
+    def step_selection(self, delta):
+        self.selection = (self.selection + delta) % len(self.options)
+        self._dirty.set()
+
+    def _prewarm(self):
+        """Asks the kernel to cache the apps' files so the exec'd app imports from RAM."""
+        # The probe should neither share RT_CPU nor pull idle CPU time from the menu.
+        self._untune_thread()
+        paths = [os.path.join(self.script_dir, 'player', 'player.py'),
+                 os.path.join(self.script_dir, 'synth', 'synth.py')]
+        try:
+            probe = subprocess.run(["nice", "-n", "19", sys.executable, "-c", PREWARM_PROBE, *PREWARM_MODULES],
+                                   capture_output=True, text=True, timeout=120)
+            paths.extend(probe.stdout.splitlines())
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"Prewarm probe failed: {e}")
+
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    def show_message(self, text, color):
+        """Draws a one-line status screen, reusing the menu's frame buffer."""
+        self._draw.rectangle((0, 0, self.width, self.height), fill="black")
+        self._draw.text((30, 100), text, font=self.font_md, fill=color)
+        self.display_frame()
+
+    def on_button(self, chip, gpio, level, tick):
+        # A press is a falling edge after BOUNCE_TIME of quiet on that pin; every
+        # edge restarts the quiet period, so press and release bounce are both dropped.
+        quiet = tick - self._last_edge.get(gpio, 0) >= BOUNCE_TIME * 1_000_000_000
+        self._last_edge[gpio] = tick
+        if level != 0 or not quiet:
+            return
+        handler = self.button_handlers.get(gpio)
+        if handler:
+            # lgpio runs every callback on one thread that dies on an uncaught error.
+            try:
+                handler()
+            except Exception as e:
+                print(f"Button handler error: {e}")
 
     def handle_selection(self):
         """Handles the selected menu option."""
         selection_name = self.options[self.selection]
         print(f"Selected: {selection_name}")
 
+        # Keep the redraw worker off the display from here on.
+        self._display_lock.acquire()
+
         # Cleanup GPIO before launching anything
         try:
-            self.btn_a.close()
-            self.btn_b.close()
-            self.btn_x.close()
+            for cb in self.button_callbacks:
+                cb.cancel()
+            lgpio.gpiochip_close(self.gpio)
         except Exception as e:
             print(f"Cleanup error: {e}")
 
+        # This runs on the tuned button thread; don't hand its core and priority on.
+        self._untune_thread()
+
         if selection_name == "Music Player":
             script_path = os.path.abspath(os.path.join(self.script_dir, 'player', 'player.py'))
             os.execv(sys.executable, [sys.executable, script_path])
@@ -99,43 +299,25 @@ class MainMenu:
             os.execv(sys.executable, [sys.executable, script_path])
 
         elif selection_name == "Reboot":
-            img = Image.new("RGB", (self.width, self.height), "black")
-            draw = ImageDraw.Draw(img)
-            draw.text((30, 100), "Rebooting...", font=self.font_md, fill="orange")
-            self.display.display(img)
-            time.sleep(1)
-            os.system("sudo reboot")
-            sys.exit()
+            self.show_message("Rebooting...", "orange")
+            # Exec straight into sudo; no shell, and the message stays up until the reboot.
+            os.execvp("sudo", ["sudo", "reboot"])
 
         elif selection_name == "Shutdown":
-            img = Image.new("RGB", (self.width, self.height), "black")
-            draw = ImageDraw.Draw(img)
-            draw.text((30, 100), "Shutting Down...", font=self.font_md, fill="red")
-            self.display.display(img)
+            self.show_message("Shutting Down...", "red")
             time.sleep(1)
             self.display.set_backlight(0)
-            os.system("sudo poweroff")
-            sys.exit()
+            os.execvp("sudo", ["sudo", "poweroff"])
 
     def run(self):
         self.draw_menu()
-        
-        def handle_up():
-            self.selection = (self.selection - 1) % len(self.options)
-            self.draw_menu()
-
-        def handle_down():
-            self.selection = (self.selection + 1) % len(self.options)
-            self.draw_menu()
-
-        self.btn_a.when_pressed = handle_up
-        self.btn_x.when_pressed = handle_down
-        self.btn_b.when_pressed = self.handle_selection
+        threading.Thread(target=self._redraw_worker, daemon=True).start()
+        threading.Thread(target=self._prewarm, daemon=True).start()
 
-        # Keep the script running
+        # Sleep until a signal arrives; button callbacks run on lgpio's thread.
         try:
             while True:
-                time.sleep(1)
+                signal.pause()
         except KeyboardInterrupt:
             print("Exiting Start Menu.")
             self.display.set_backlight(0)
@@ -5,7 +5,7 @@ set -e
 
 echo "--- Part 1: Installing system dependencies ---"
 sudo apt update
-sudo apt install -y python3-venv python3-pip python3-pygame fluidsynth libsdl2-dev libsdl2-image-dev libsdl2-mixer-dev libsdl2-ttf-dev libjpeg-dev libpng-dev
+sudo apt install -y python3-venv python3-pip python3-pygame fluidsynth libsdl2-dev libsdl2-image-dev libsdl2-mixer-dev libsdl2-ttf-dev libjpeg-dev libpng-dev libasound2-dev
 
 echo "--- Configuring /boot/firmware/config.txt for Pirate Audio HAT ---"
 
@@ -27,6 +27,11 @@ if ! grep -q "^dtparam=audio=off" /boot/firmware/config.txt; then
   echo "dtparam=audio=off" | sudo tee -a /boot/firmware/config.txt > /dev/null
 fi
 
+# Raise spidev's transfer size so a whole 240x240 RGB565 frame is one SPI write
+if ! grep -q "spidev.bufsiz=" /boot/firmware/cmdline.txt; then
+  sudo sed -i -e '1 s/$/ spidev.bufsiz=131072/' /boot/firmware/cmdline.txt
+fi
+
 echo ""
 echo "--- Configuring audio to use the Pirate Audio HAT ---"
 ASOUND_CONFIG="pcm.softvol {
@@ -1,5 +1,15 @@
-import pygame.midi
+import signal
+import sys
 import time
+import pygame.midi
+
+# python-rtmidi is optional: with it, events arrive through its callback
+# instead of the poll loop below. Device IDs stay the pygame.midi ones the
+# synth's config uses.
+try:
+    import rtmidi
+except ImportError:
+    rtmidi = None
 
 def list_midi_devices():
     pygame.midi.init()
@@ -18,16 +28,48 @@ def list_midi_devices():
     print("---------------------------------")
     return found_devices
 
+def find_rtmidi_port(device_id):
+    """Returns the rtmidi input port matching a pygame.midi device ID, or None."""
+    info = pygame.midi.get_device_info(device_id)
+    if rtmidi is None or info is None:
+        return None
+    name = info[1].decode('utf-8')
+    for port, port_name in enumerate(rtmidi.MidiIn().get_ports()):
+        if name in port_name:
+            return port
+    return None
+
+def monitor_rtmidi(port):
+    midi_in = rtmidi.MidiIn()
+    try:
+        midi_in.open_port(port)
+        midi_in.ignore_types(sysex=False)  # clock and active sensing stay filtered
+        midi_in.set_callback(lambda event, _: print(f"MIDI Event: {event[0]} (+{event[1]:.4f}s)", flush=True))
+        while True:
+            signal.pause()
+    except KeyboardInterrupt as e:
+        print(f"\nExiting monitor. ({e})")
+    finally:
+        midi_in.close_port()
+
 def monitor_device(device_id):
     print(f"\nMonitoring device ID: {device_id}. Press Ctrl+C to exit.")
+    port = find_rtmidi_port(device_id)
+    if port is not None:
+        monitor_rtmidi(port)
+        return
     try:
         midi_input = pygame.midi.Input(device_id)
         while True:
             if midi_input.poll():
-                events = midi_input.read(16)
-                for event in events:
-                    print(f"MIDI Event: {event}")
-            time.sleep(0.01)
+                # Drain the whole queue and write the batch in one go; printing
+                # line by line is slower than a burst of pressure events.
+                events = midi_input.read(1024)
+                sys.stdout.write("".join(f"MIDI Event: {event}\n" for event in events))
+            else:
+                sys.stdout.flush()
+                # Only back off while the queue is empty, and only briefly.
+                time.sleep(0.001)
     except (pygame.midi.MidiException, KeyboardInterrupt) as e:
         print(f"\nExiting monitor. ({e})")
     finally:
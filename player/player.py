@@ -3,19 +3,63 @@
 import os
 import sys
 import subprocess
+import concurrent.futures
+import functools
+import hashlib
 import json
+import numpy as np
+import queue
+import threading
 import st7789
 from gpiozero import Button
 from PIL import Image, ImageDraw, ImageFont
 import pygame
-import glob
 import time
 import random
 
+# orjson is optional: it parses and writes the library several times faster
+# than the json module, which stays as the fallback. The file format is the same.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# mutagen is optional too: it reads a song's length from the MP3 headers at
+# scan time. Without it the player measures each song when it is loaded.
+try:
+    from mutagen.mp3 import MP3
+except ImportError:
+    MP3 = None
+
 # --- CRITICAL FIX FOR PI 4 / BOOKWORM ---
 os.environ['GPIOZERO_PIN_FACTORY'] = 'lgpio'
 # ----------------------------------------
 
+# Album art file name endings, most preferred first.
+ART_FILE_NAMES = ("art.jpg", "art.png", "folder.jpg", "folder.png")
+
+def song_duration(path):
+    """Length of an MP3 in seconds from its headers, or None if it cannot be read."""
+    if MP3 is None:
+        return None
+    try:
+        return MP3(path).info.length
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=512)
+def text_width(font, text):
+    """Cached text advance; titles and labels repeat on every frame."""
+    return font.getlength(text)
+
+@functools.lru_cache(maxsize=128)
+def glyph_mask(font, char):
+    """Cached coverage mask and advance for one character of per-frame text."""
+    _, _, right, bottom = font.getbbox(char)
+    mask = Image.new("L", (max(right, 1), max(bottom, 1)), 0)
+    ImageDraw.Draw(mask).text((0, 0), char, font=font, fill=255)
+    return mask, font.getlength(char)
+
 class PiratePlayer:
     def __init__(self, config):
         self.config = config
@@ -42,14 +86,24 @@ class PiratePlayer:
         self.last_tick = 0.0
         self.current_song_duration = 1.0
         self.current_volume = 1.0
-        self.current_random_bg = (50, 50, 50)
+        self.current_random_bg = None
         self.press_times = {'a': 0, 'b': 0, 'x': 0, 'y': 0}
+        self.last_edge = {'a': 0, 'b': 0, 'x': 0, 'y': 0}
+        self.pressed = {'a': False, 'b': False, 'x': False, 'y': False}
         self.needs_redraw = True
         self.player_bg_buffer = None
+        self.shown_view = None
+        self._last_displayed_second = -1
+        self.list_state = None
+        self.list_rows = []
         self.requested_action = None
 
+        self._save_queue = queue.Queue()
+        threading.Thread(target=self._save_worker, daemon=True).start()
+
         self._init_hardware()
         self._init_visuals()
+        self.list_row = functools.lru_cache(maxsize=64)(self.render_list_row)
 
     def _init_hardware(self):
         """Initializes the display and buttons based on the config."""
@@ -62,21 +116,23 @@ class PiratePlayer:
         )
         self.display.begin()
         self.width, self.height = self.display.width, self.display.height
+        self.rotation = display_conf["rotation"]
+        # One frame buffer shared by every view; draws repaint it in place instead of allocating.
+        self.screen = Image.new("RGB", (self.width, self.height), "black")
+        self.screen_draw = ImageDraw.Draw(self.screen)
 
+        # Debounced in record_press/handle_release from edge timestamps, so gpiozero
+        # delivers every edge straight from the pin interrupt.
         btn_conf = self.config["hardware"]["buttons"]
-        self.btn_a = Button(btn_conf["a"], pull_up=True, bounce_time=btn_conf["bounce_time"])
-        self.btn_b = Button(btn_conf["b"], pull_up=True, bounce_time=btn_conf["bounce_time"])
-        self.btn_x = Button(btn_conf["x"], pull_up=True, bounce_time=btn_conf["bounce_time"])
-        self.btn_y = Button(btn_conf["y"], pull_up=True, bounce_time=btn_conf["bounce_time"])
-
-        self.btn_a.when_pressed = lambda: self.record_press('a')
-        self.btn_a.when_released = lambda: self.handle_release('a')
-        self.btn_x.when_pressed = lambda: self.record_press('x')
-        self.btn_x.when_released = lambda: self.handle_release('x')
-        self.btn_b.when_pressed = lambda: self.record_press('b')
-        self.btn_b.when_released = lambda: self.handle_release('b')
-        self.btn_y.when_pressed = lambda: self.record_press('y')
-        self.btn_y.when_released = lambda: self.handle_release('y')
+        self.bounce_time = btn_conf["bounce_time"]
+        self.btn_a = Button(btn_conf["a"], pull_up=True, bounce_time=None)
+        self.btn_b = Button(btn_conf["b"], pull_up=True, bounce_time=None)
+        self.btn_x = Button(btn_conf["x"], pull_up=True, bounce_time=None)
+        self.btn_y = Button(btn_conf["y"], pull_up=True, bounce_time=None)
+
+        for btn_char, btn in (('a', self.btn_a), ('x', self.btn_x), ('b', self.btn_b), ('y', self.btn_y)):
+            btn.when_pressed = functools.partial(self.record_press, btn_char)
+            btn.when_released = functools.partial(self.handle_release, btn_char)
 
     def _init_visuals(self):
         """Initializes colors and fonts based on the config."""
@@ -89,10 +145,12 @@ class PiratePlayer:
         try:
             font_conf = self.config["visuals"]["font"]
             font_path = os.path.abspath(os.path.join(self.script_dir, '..', font_conf["file"]))
-            self.font_lg = ImageFont.truetype(font_path, font_conf["large_size"])
-            self.font_md = ImageFont.truetype(font_path, font_conf["medium_size"])
-            self.font_sm = ImageFont.truetype(font_path, font_conf["small_size"])
-            self.font_mono = ImageFont.truetype(font_path, font_conf["mono_size"])
+            # BASIC layout skips Raqm shaping, which titles on this display don't need.
+            layout = ImageFont.Layout.BASIC
+            self.font_lg = ImageFont.truetype(font_path, font_conf["large_size"], layout_engine=layout)
+            self.font_md = ImageFont.truetype(font_path, font_conf["medium_size"], layout_engine=layout)
+            self.font_sm = ImageFont.truetype(font_path, font_conf["small_size"], layout_engine=layout)
+            self.font_mono = ImageFont.truetype(font_path, font_conf["mono_size"], layout_engine=layout)
         except (OSError, IOError) as e:
             print(f"Warning: Could not load custom font. {e}")
             print("Falling back to default font.")
@@ -102,12 +160,79 @@ class PiratePlayer:
             self.font_mono = ImageFont.load_default()
 
     def get_text_center(self, draw, text, font):
-        return (self.width - draw.textlength(text, font=font)) // 2
-
-    def generate_random_color(self):
-        return (random.randint(50, 200), random.randint(50, 200), random.randint(50, 200))
+        return (self.width - text_width(font, text)) // 2
+
+    def draw_glyphs(self, img, xy, text, font, fill, center=False):
+        """Draws text by pasting cached glyph masks instead of laying it out again."""
+        glyphs = [glyph_mask(font, char) for char in text]
+        x, y = xy
+        if center:
+            x = (self.width - sum(advance for _, advance in glyphs)) // 2
+        for mask, advance in glyphs:
+            img.paste(fill, (round(x), y), mask)
+            x += advance
+
+    def panel_window(self, x0, y0, x1, y1):
+        """Maps a frame rectangle to the panel window it occupies after rotation."""
+        w, h = self.width - 1, self.height - 1
+        if self.rotation == 90:
+            return y0, w - x1, y1, w - x0
+        if self.rotation == 180:
+            return w - x1, h - y1, w - x0, h - y0
+        if self.rotation == 270:
+            return h - y1, x0, h - y0, x1
+        return x0, y0, x1, y1
+
+    def pack_rgb565(self, arr):
+        """Packs an (h, w, 3) RGB array into an (h, w) array of big-endian RGB565 pixels."""
+        r, g, b = (arr[..., i].astype(np.uint16) for i in range(3))
+        return (((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)).astype(">u2")
+
+    def to_rgb565(self, img):
+        """Rotates an RGB image for the panel and packs it into big-endian RGB565 bytes."""
+        return np.rot90(self.pack_rgb565(np.asarray(img)), self.rotation // 90).tobytes()
+
+    def push(self, img, box=None):
+        """Sends a full-screen image, or one (left, upper, right, lower) box of it, to the panel."""
+        if box is None:
+            box = (0, 0, self.width, self.height)
+        else:
+            img = img.crop(box)
+        self.write_window(box, self.to_rgb565(img))
+
+    def write_window(self, box, pixelbytes):
+        """Writes panel-ordered RGB565 bytes into the window for a (left, upper, right, lower) box."""
+        self.display.set_window(*self.panel_window(box[0], box[1], box[2] - 1, box[3] - 1))
+        # writebytes2 takes the bytes as-is and splits them at spidev's bufsiz,
+        # so with spidev.bufsiz=131072 a full frame goes out in one transfer.
+        self.display.send([], True)  # raise D/C for data
+        self.display._spi.writebytes2(pixelbytes)
+
+    def get_art_thumbnail(self, art_path):
+        """Returns album art scaled to the display, via an uncompressed on-disk cache."""
+        cache_dir = os.path.expanduser(self.config["paths"].get("thumbnail_cache", "~/.cache/pirateplayer"))
+        key = hashlib.sha1(art_path.encode("utf-8")).hexdigest()
+        cache_path = os.path.join(cache_dir, f"{key}_{self.width}x{self.height}.bmp")
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(art_path):
+                return Image.open(cache_path)
+        except OSError:
+            pass
 
-    def save_library(self):
+        thumb = Image.open(art_path).convert("RGB").resize((self.width, self.height), Image.Resampling.BILINEAR)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            thumb.save(cache_path + ".tmp", format="BMP")
+            os.replace(cache_path + ".tmp", cache_path)
+        except OSError as e:
+            print(f"Could not cache album art: {e}")
+        return thumb
+
+    def get_library_path(self):
+        return os.path.abspath(os.path.join(self.script_dir, '..', self.config["paths"]["library_file"]))
+
+    def save_library(self, wait=False):
+        """Queues a library snapshot for the save worker; wait=True blocks until it is on disk."""
         data = {
             "database": self.music_database,
             "last_state": {
@@ -116,20 +241,46 @@ class PiratePlayer:
                 "volume": self.current_volume
             }
         }
-        try:
-            library_path = os.path.abspath(os.path.join(self.script_dir, '..', self.config["paths"]["library_file"]))
-            with open(library_path, 'w') as f:
-                json.dump(data, f)
-        except Exception as e:
-            print(f"Error saving library: {e}")
+        self._save_queue.put(data)
+        if wait:
+            self._save_queue.join()
+
+    def _save_worker(self):
+        """Writes queued snapshots, keeping only the newest of any burst of saves."""
+        while True:
+            data = self._save_queue.get()
+            pending = 1
+            while True:
+                try:
+                    data = self._save_queue.get(timeout=0.3)
+                    pending += 1
+                except queue.Empty:
+                    break
+            try:
+                library_path = self.get_library_path()
+                if orjson is not None:
+                    with open(library_path + ".tmp", 'wb') as f:
+                        f.write(orjson.dumps(data))
+                else:
+                    with open(library_path + ".tmp", 'w') as f:
+                        json.dump(data, f)
+                os.replace(library_path + ".tmp", library_path)
+            except Exception as e:
+                print(f"Error saving library: {e}")
+            for _ in range(pending):
+                self._save_queue.task_done()
 
     def load_library(self):
-        library_path = os.path.join(self.script_dir, self.config["paths"]["library_file"])
+        library_path = self.get_library_path()
         if not os.path.exists(library_path):
             return False
         try:
-            with open(library_path, 'r') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(library_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(library_path, 'r') as f:
+                    data = json.load(f)
             self.music_database = data.get("database", [])
             state = data.get("last_state", {})
             self.current_album_index = state.get("album_index", 0)
@@ -149,7 +300,7 @@ class PiratePlayer:
         d = ImageDraw.Draw(img)
         d.text((20, 100), "Scanning Music...", font=self.font_md, fill="cyan")
         d.text((20, 130), "Please Wait", font=self.font_sm, fill="white")
-        self.display.display(img)
+        self.push(img)
         
         try:
             entries = sorted([f.path for f in os.scandir(music_dir) if f.is_dir()])
@@ -157,35 +308,58 @@ class PiratePlayer:
             print("Music dir not found.")
             return
 
-        for album_path in entries:
-            album_name = os.path.basename(album_path)
-            songs = sorted(glob.glob(os.path.join(album_path, "*.mp3")))
-            if not songs: continue
-
-            art_path = None
-            for ext in ["art.jpg", "art.png", "folder.jpg", "folder.png"]:
-                matches = glob.glob(os.path.join(album_path, "*"))
-                for f in matches:
-                    if f.lower().endswith(ext):
-                        art_path = f
-                        break
-                if art_path: break
-            
-            self.music_database.append({
-                "album": album_name, "artist": "Unknown Artist",
-                "art_path": art_path, "songs": songs
-            })
+        # Album reads are I/O bound, so overlap them; map() keeps the sorted order.
+        # The header stays in img, only the progress line is redrawn.
+        total = len(entries)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            for count, album in enumerate(pool.map(self.scan_album, entries), 1):
+                if album: self.music_database.append(album)
+                if count % 10 == 0 or count == total:
+                    d.rectangle((0, 130, self.width, self.height), fill="black")
+                    d.text((20, 130), f"Scanned {count} / {total}", font=self.font_sm, fill="white")
+                    self.push(img)
         
         print(f"Found {len(self.music_database)} albums.")
         self.save_library()
 
+    def scan_album(self, album_path):
+        """Returns the library entry for one album directory, or None if it has no songs."""
+        # One directory read for songs and art; keep the best-ranked art seen so far.
+        songs = []
+        art_path, art_rank = None, len(ART_FILE_NAMES)
+        try:
+            with os.scandir(album_path) as it:
+                for entry in it:
+                    if entry.name.startswith('.') or not entry.is_file():
+                        continue
+                    if entry.name.endswith(".mp3"):
+                        songs.append(entry.path)
+                        continue
+                    name = entry.name.lower()
+                    for rank in range(art_rank):
+                        if name.endswith(ART_FILE_NAMES[rank]):
+                            art_path, art_rank = entry.path, rank
+                            break
+        except OSError as e:
+            # Skip unreadable albums, as glob did, rather than failing the whole scan.
+            print(f"Skipping {album_path}: {e}")
+            return None
+        if not songs: return None
+        songs.sort()
+
+        return {
+            "album": os.path.basename(album_path), "artist": "Unknown Artist",
+            "art_path": art_path, "songs": songs,
+            "durations": [song_duration(song) for song in songs]
+        }
+
     def launch_synth(self):
         print("Launching Synthesizer...")
-        self.save_library()
+        self.save_library(wait=True)
         img = Image.new("RGB", (self.width, self.height), "black")
         d = ImageDraw.Draw(img)
         d.text((40, 100), "Loading Synth...", font=self.font_md, fill="cyan")
-        self.display.display(img)
+        self.push(img)
         try:
             pygame.mixer.quit()
             self.btn_a.close()
@@ -200,7 +374,7 @@ class PiratePlayer:
 
     def launch_menu(self):
         print("Returning to Main Menu...")
-        self.save_library()
+        self.save_library(wait=True)
         try:
             pygame.mixer.quit()
             self.btn_a.close()
@@ -213,11 +387,24 @@ class PiratePlayer:
         menu_script_path = os.path.abspath(os.path.join(self.script_dir, '..', 'Start.py'))
         os.execv(sys.executable, [sys.executable, menu_script_path])
 
+    def is_clean_edge(self, btn_char, now):
+        """True if the button was quiet for bounce_time; every edge restarts the quiet period."""
+        quiet = now - self.last_edge[btn_char] >= self.bounce_time
+        self.last_edge[btn_char] = now
+        return quiet
+
     def record_press(self, btn_char):
-        self.press_times[btn_char] = time.time()
+        now = time.monotonic()
+        if self.is_clean_edge(btn_char, now):
+            self.press_times[btn_char] = now
+            self.pressed[btn_char] = True
 
     def handle_release(self, btn_char):
-        duration = time.time() - self.press_times[btn_char]
+        now = time.monotonic()
+        if not self.is_clean_edge(btn_char, now): return
+        # A press dropped as bounce and not yet picked up by main_loop_tick counts as a tap.
+        duration = now - self.press_times[btn_char] if self.pressed[btn_char] else 0.0
+        self.pressed[btn_char] = False
         
         long_press = self.config["behavior"]["long_press_s"]
         if btn_char == 'y' and duration > long_press["menu"]: return
@@ -299,7 +486,7 @@ class PiratePlayer:
             img = Image.new("RGB", (self.width, self.height), "black")
             d = ImageDraw.Draw(img)
             d.text((10, 50), "No Music Found", font=self.font_md, fill=self.ALERT_COLOR)
-            self.display.display(img)
+            self.push(img)
         else:
             self.current_playlist = self.music_database[self.current_album_index]["songs"]
             if self.current_playlist_index >= len(self.current_playlist): self.current_playlist_index = 0
@@ -316,11 +503,18 @@ class PiratePlayer:
             self.cleanup()
             
     def main_loop_tick(self):
-        current_time = time.time()
+        current_time = time.monotonic()
         long_press = self.config["behavior"]["long_press_s"]
 
         if self.requested_action: self.handle_requested_action()
 
+        # A press inside the bounce window of the last release is dropped; start
+        # timing it here instead of from the previous press.
+        for btn_char, btn in (('a', self.btn_a), ('x', self.btn_x), ('b', self.btn_b), ('y', self.btn_y)):
+            if btn.is_active and not self.pressed[btn_char]:
+                self.press_times[btn_char] = current_time
+                self.pressed[btn_char] = True
+
         if self.btn_a.is_active and (current_time - self.press_times['a'] > long_press["volume"]):
              if int(current_time * 10) % 2 == 0: self.change_volume(-0.02)
         if self.btn_x.is_active and (current_time - self.press_times['x'] > long_press["volume"]):
@@ -336,7 +530,8 @@ class PiratePlayer:
             self.last_tick = current_time
             if not pygame.mixer.music.get_busy():
                 self.change_song(1)
-            if self.current_view == self.VIEW_PLAYER:
+            # The time text only changes once a second; volume and buttons set needs_redraw themselves.
+            if self.current_view == self.VIEW_PLAYER and int(self.playback_time) != self._last_displayed_second:
                 self.needs_redraw = True
 
         if self.needs_redraw:
@@ -352,17 +547,17 @@ class PiratePlayer:
             self.perform_rebuild()
             self.current_view = self.VIEW_PLAYER
         elif act == "reboot":
-            self.save_library()
+            self.save_library(wait=True)
             os.system("sudo reboot")
             sys.exit()
         elif act == "shutdown":
-            self.save_library()
+            self.save_library(wait=True)
             
             # Display shutdown message and turn off backlight
             img = Image.new("RGB", (self.width, self.height), "black")
             draw = ImageDraw.Draw(img)
             draw.text((self.get_text_center(draw, "Shutting Down...", self.font_md), 110), "Shutting Down...", font=self.font_md, fill=self.ALERT_COLOR)
-            self.display.display(img)
+            self.push(img)
             time.sleep(1) # Give user a moment to see the message
             self.display.set_backlight(0)
             
@@ -371,7 +566,7 @@ class PiratePlayer:
 
     def cleanup(self):
         try:
-            self.save_library()
+            self.save_library(wait=True)
             pygame.mixer.music.stop()
             self.display.set_backlight(0)
         except:
@@ -385,16 +580,14 @@ class PiratePlayer:
         self.needs_redraw = True
 
     def update_display(self):
-        if self.current_view == self.VIEW_PLAYER: self.draw_player_screen()
+        if self.current_view == self.VIEW_PLAYER: self.draw_player_screen(full_redraw=self.shown_view != self.VIEW_PLAYER)
         elif self.current_view == self.VIEW_ALBUM_BROWSER: self.draw_album_browser()
         elif self.current_view == self.VIEW_SONG_BROWSER: self.draw_song_browser()
         elif self.current_view == self.VIEW_SYSTEM_MENU: self.draw_system_menu()
+        self.shown_view = self.current_view
 
     def draw_player_screen(self, full_redraw=True):
         if full_redraw or self.player_bg_buffer is None:
-            img = Image.new("RGB", (self.width, self.height))
-            draw = ImageDraw.Draw(img, "RGBA")
-            
             if not self.music_database or self.current_album_index >= len(self.music_database): return
             
             album = self.music_database[self.current_album_index]
@@ -402,31 +595,50 @@ class PiratePlayer:
             if self.current_playlist and self.current_playlist_index < len(self.current_playlist):
                 song_title = os.path.basename(self.current_playlist[self.current_playlist_index]).replace(".mp3", "")
 
+            bg = None
             if album["art_path"] and os.path.exists(album["art_path"]):
                 try:
-                    art_img = Image.open(album["art_path"]).resize((self.width, self.height))
-                    img.paste(art_img, (0, 0))
+                    bg = np.array(self.get_art_thumbnail(album["art_path"]), dtype=np.uint8)
                 except:
-                    draw.rectangle((0, 0, self.width, self.height), fill=self.current_random_bg)
-            else:
-                draw.rectangle((0, 0, self.width, self.height), fill=self.current_random_bg)
-
-            draw.rectangle((0, 0, self.width, self.height), fill=(0, 0, 0, 150))
+                    pass
+            if bg is None:
+                # Albums without art get a random backdrop, picked once per song.
+                if self.current_random_bg is None:
+                    self.current_random_bg = tuple(50 + b * 151 // 256 for b in random.randbytes(3))
+                bg = np.full((self.height, self.width, 3), self.current_random_bg, dtype=np.uint8)
+
+            # Darken towards black by scaling the pixels in place; no compositing pass.
+            np.multiply(bg, 1 - 150 / 255, out=bg, casting='unsafe')
+            img = Image.fromarray(bg)
+            draw = ImageDraw.Draw(img)
             draw.text((self.get_text_center(draw, song_title, self.font_lg), 80), song_title, font=self.font_lg, fill=self.TEXT_COLOR)
             draw.text((self.get_text_center(draw, album["artist"], self.font_md), 110), album["artist"], font=self.font_md, fill=self.DIM_TEXT_COLOR)
             draw.rectangle((20, self.height - 30, self.width - 20, self.height - 28), fill=(80, 80, 80))
-            self.player_bg_buffer = img.copy().convert("RGB")
-
-        final_img = self.player_bg_buffer.copy()
-        draw = ImageDraw.Draw(final_img)
+            self.player_bg_buffer = img
+            # The progress bar is kept as packed pixels of its empty track; each
+            # frame fills a copy up to the current position and sends it as is.
+            self.bar_box = (20, self.height - 30, self.width - 19, self.height - 27)
+            self.bar_track = self.pack_rgb565(np.asarray(img.crop(self.bar_box)))
+            self.bar_fill = self.pack_rgb565(np.array([[(0, 255, 255)]], dtype=np.uint8))[0, 0]
+            full_redraw = True
+
+        # Only the volume and time/icon bands change between full redraws, so
+        # those are restored from the background and sent on their own.
+        bands = ((self.width - 75, 0, self.width, 25), (0, 135, self.width, 196))
+        final_img, draw = self.screen, self.screen_draw
+        if full_redraw:
+            final_img.paste(self.player_bg_buffer)
+        else:
+            for band in bands:
+                final_img.paste(self.player_bg_buffer.crop(band), band[:2])
 
         cur_s, dur_s = int(self.playback_time), int(self.current_song_duration)
+        self._last_displayed_second = cur_s
         time_str = f"{cur_s // 60}:{cur_s % 60:02d} / {dur_s // 60}:{dur_s % 60:02d}"
-        draw.text((self.get_text_center(draw, time_str, self.font_sm), 140), time_str, font=self.font_sm, fill=self.DIM_TEXT_COLOR)
+        self.draw_glyphs(final_img, (0, 140), time_str, self.font_sm, self.DIM_TEXT_COLOR, center=True)
 
         pct = self.playback_time / self.current_song_duration if self.current_song_duration > 0 else 0
         bar_w = int((self.width - 40) * min(pct, 1.0))
-        draw.rectangle((20, self.height - 30, 20 + bar_w, self.height - 28), fill="cyan")
 
         cx = self.width // 2
         if self.is_playing:
@@ -436,59 +648,71 @@ class PiratePlayer:
             draw.polygon([(cx - 5, 170), (cx - 5, 190), (cx + 10, 180)], fill=self.TEXT_COLOR)
         
         vol_txt = f"Vol: {int(self.current_volume * 100)}%"
-        draw.text((self.width - 70, 5), vol_txt, font=self.font_sm, fill=self.DIM_TEXT_COLOR)
-        self.display.display(final_img)
+        self.draw_glyphs(final_img, (self.width - 70, 5), vol_txt, self.font_sm, self.DIM_TEXT_COLOR)
+        if full_redraw:
+            self.push(final_img)
+        else:
+            for band in bands:
+                self.push(final_img, band)
+        bar = self.bar_track.copy()
+        bar[:, :bar_w + 1] = self.bar_fill
+        self.write_window(self.bar_box, np.rot90(bar, self.rotation // 90).tobytes())
+
+    def render_list_row(self, label, highlighted):
+        """Rasterizes one browser row; cached through self.list_row in __init__."""
+        row = Image.new("RGB", (self.width, 26), "black")
+        draw = ImageDraw.Draw(row)
+        if highlighted:
+            draw.rectangle((0, 0, self.width, 24), fill=self.HIGHLIGHT_COLOR)
+        color = self.TEXT_COLOR if highlighted else self.DIM_TEXT_COLOR
+        draw.text((10, 0), f"{'> ' if highlighted else '  '}{label}", font=self.font_mono, fill=color)
+        return row
+
+    def draw_list_view(self, header, header_font, items, index, label):
+        """Draws a scrolling six-row browser, sending only the changed rows on a plain scroll."""
+        start_idx = max(0, index - 3)
+        rows = [(label(item), start_idx + i == index) for i, item in enumerate(items[start_idx:start_idx + 6])]
+        rows += [("", False)] * (6 - len(rows))
+        state = (self.current_view, header)
+
+        if self.shown_view == self.current_view and self.list_state == state:
+            dirty = [i for i, row in enumerate(rows) if row != self.list_rows[i]]
+            self.list_rows = rows
+            if not dirty: return
+            for i in dirty:
+                self.screen.paste(self.list_row(*rows[i]), (0, 40 + 26 * i))
+            self.push(self.screen, (0, 40 + 26 * dirty[0], self.width, 66 + 26 * dirty[-1]))
+            return
 
-    def draw_album_browser(self):
-        img = Image.new("RGB", (self.width, self.height), "black")
-        draw = ImageDraw.Draw(img)
-        draw.text((10, 5), "Albums", font=self.font_lg, fill=self.HIGHLIGHT_COLOR)
+        img, draw = self.screen, self.screen_draw
+        draw.rectangle((0, 0, self.width, self.height), fill="black")
+        draw.text((10, 5), header, font=header_font, fill=self.HIGHLIGHT_COLOR)
         draw.line((10, 30, self.width - 10, 30), fill=self.HIGHLIGHT_COLOR, width=1)
-        
-        y, h = 40, 24
-        start_idx = max(0, self.album_browser_index - 3)
-        visible_albums = self.music_database[start_idx:start_idx + 6]
-        
-        for i, album in enumerate(visible_albums):
-            real_idx = start_idx + i
-            name = album['album'];
+        for i, row in enumerate(rows):
+            img.paste(self.list_row(*row), (0, 40 + 26 * i))
+        self.list_state, self.list_rows = state, rows
+        self.push(img)
+
+    def draw_album_browser(self):
+        def album_label(album):
+            name = album['album']
             if len(name) > 18: name = name[:17] + ".."
-            color = self.TEXT_COLOR if real_idx == self.album_browser_index else self.DIM_TEXT_COLOR
-            if real_idx == self.album_browser_index:
-                draw.rectangle((0, y, self.width, y + h), fill=self.HIGHLIGHT_COLOR)
-            draw.text((10, y), f"{'> ' if real_idx == self.album_browser_index else '  '}{name}", font=self.font_mono, fill=color)
-            y += h + 2
-        self.display.display(img)
+            return name
+        self.draw_list_view("Albums", self.font_lg, self.music_database, self.album_browser_index, album_label)
 
     def draw_song_browser(self):
-        img = Image.new("RGB", (self.width, self.height), "black")
-        draw = ImageDraw.Draw(img)
-        
         album = self.music_database[self.album_browser_index]
         header = album['album'];
         if len(header) > 15: header = header[:14] + ".."
-        draw.text((10, 5), header, font=self.font_md, fill=self.HIGHLIGHT_COLOR)
-        draw.line((10, 30, self.width - 10, 30), fill=self.HIGHLIGHT_COLOR, width=1)
-
-        y, h = 40, 24
-        songs = album['songs']
-        start_idx = max(0, self.song_browser_index - 3)
-        visible_songs = songs[start_idx:start_idx + 6]
 
-        for i, song_path in enumerate(visible_songs):
-            real_idx = start_idx + i
+        def song_label(song_path):
             title = os.path.basename(song_path).replace(".mp3", "")
             if len(title) > 18: title = title[:17] + ".."
-            color = self.TEXT_COLOR if real_idx == self.song_browser_index else self.DIM_TEXT_COLOR
-            if real_idx == self.song_browser_index:
-                draw.rectangle((0, y, self.width, y + h), fill=self.HIGHLIGHT_COLOR)
-            draw.text((10, y), f"{'> ' if real_idx == self.song_browser_index else '  '}{title}", font=self.font_mono, fill=color)
-            y += h + 2
-        self.display.display(img)
+            return title
+        self.draw_list_view(header, self.font_md, album['songs'], self.song_browser_index, song_label)
 
     def draw_system_menu(self):
-        img = Image.new("RGB", (self.width, self.height), "black")
-        draw = ImageDraw.Draw(img)
+        img, draw = self.screen, self.screen_draw
         
         draw.rectangle((0, 0, self.width, self.height), fill=(40, 10, 10))
         draw.text((10, 5), "System Menu", font=self.font_lg, fill=self.ALERT_COLOR)
@@ -502,12 +726,12 @@ class PiratePlayer:
             else:
                 draw.text((20, y + 5), f"  {option}", font=self.font_md, fill=self.DIM_TEXT_COLOR)
             y += h + 5
-        self.display.display(img)
+        self.push(img)
 
     def load_song_data(self):
         self.playback_time = 0.0
-        self.last_tick = time.time()
-        self.current_random_bg = self.generate_random_color()
+        self.last_tick = time.monotonic()
+        self.current_random_bg = None
 
         if not self.current_playlist: return
         path = self.current_playlist[self.current_playlist_index]
@@ -515,8 +739,14 @@ class PiratePlayer:
         try:
             pygame.mixer.music.load(path)
             pygame.mixer.music.set_volume(self.current_volume)
-            try: self.current_song_duration = pygame.mixer.Sound(path).get_length()
-            except: self.current_song_duration = 1.0
+            # Libraries scanned without mutagen (or before it) have no stored durations.
+            durations = self.music_database[self.current_album_index].get("durations") or []
+            duration = durations[self.current_playlist_index] if self.current_playlist_index < len(durations) else None
+            if duration:
+                self.current_song_duration = duration
+            else:
+                try: self.current_song_duration = pygame.mixer.Sound(path).get_length()
+                except: self.current_song_duration = 1.0
         except Exception as e: print(f"Load Failed: {e}")
 
     def start_album_playback(self, alb_idx, song_idx=0):
@@ -1,21 +1,64 @@
 #!/usr/bin/env python3
 
+import functools
 import os
+import queue
 import sys
+import threading
 import time
 import glob
 import json
-import pygame
+import numpy as np
 import pygame.midi
 import fluidsynth
 import st7789
 from gpiozero import Button
 from PIL import Image, ImageDraw, ImageFont
 
+# orjson is optional: it reads and writes the config and library faster than
+# the json module, which stays as the fallback. The file format is the same.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyalsaaudio is optional: it sets the Amp control in-process. Without it
+# the synth falls back to running amixer through the shell.
+try:
+    import alsaaudio
+except ImportError:
+    alsaaudio = None
+
 # --- HARDWARE & CONFIG ---
 os.environ['GPIOZERO_PIN_FACTORY'] = 'lgpio'
 BTN_A_PIN, BTN_B_PIN, BTN_X_PIN, BTN_Y_PIN = 5, 6, 16, 24
+# Slots in press_times.
+BTN_A_IDX, BTN_B_IDX, BTN_X_IDX, BTN_Y_IDX = 0, 1, 2, 3
 BOUNCE_TIME = 0.05
+# A/X held past this ramp the gain instead of moving the selection.
+LONG_PRESS_THRESHOLD = 0.3
+DISPLAY_ROTATION = 90
+# Full PortMidi rescans while disconnected: this many checks after a MIDI device
+# node changes (the sequencer client can lag the node), and at least this often
+# for inputs that have no node at all (BLE MIDI, virtual ports).
+MIDI_SETTLE_RESCANS = 3
+MIDI_RESCAN_INTERVAL = 10.0
+
+@functools.lru_cache(maxsize=256)
+def text_width(font, text):
+    """Cached text advance; the gain readout only takes a few hundred values."""
+    return font.getlength(text)
+
+def read_json(path):
+    if orjson is not None:
+        with open(path, 'rb') as f: return orjson.loads(f.read())
+    with open(path, 'r') as f: return json.load(f)
+
+def write_json(path, data):
+    if orjson is not None:
+        with open(path, 'wb') as f: f.write(orjson.dumps(data))
+    else:
+        with open(path, 'w') as f: json.dump(data, f)
 
 class FluidSynthApp:
     def __init__(self):
@@ -29,19 +72,38 @@ class FluidSynthApp:
         # --- Display & UI ---
         self._init_display()
         self._init_fonts()
+        self._waiting_midi_img = self._render_waiting_midi()
+        self._no_sf_img = self._render_no_sf()
+        self._list_img, _ = self._render_frame(True)
+        # draw_ui repaints this one canvas from the cached frames above.
+        self._canvas = Image.new("RGB", (self.width, self.height), "black")
+        self._draw = ImageDraw.Draw(self._canvas)
+        self.list_row = functools.lru_cache(maxsize=64)(self.render_list_row)
         self.soundfonts = []
+        self._sf_names = []
         self.sf_selection = 0
         self.needs_redraw = True
+        self._last_state = None
+        self._list_rows = None
         print("FluidSynthApp: Display & Fonts initialized.")
 
         # --- Audio & MIDI ---
+        # One loader thread takes soundfont requests in order; results that a
+        # newer request has superseded are unloaded instead of selected.
+        self._sf_requests = queue.Queue()
+        self._loaded_sfs = queue.Queue()
+        self._sf_generation = 0
+        self._sf_requested_path = None
+        self._sf_path = None
+        self._message_until = 0.0
         self._init_audio()
+        threading.Thread(target=self._sf_loader, daemon=True).start()
         self._init_midi()
         print("FluidSynthApp: Audio & MIDI initialized.")
 
         # --- Buttons ---
+        self.press_times = [0.0] * 4
         self._init_buttons()
-        self.press_times = {'a': 0, 'b': 0, 'x': 0, 'y': 0}
         print("FluidSynthApp: Buttons initialized.")
         
         # --- Load Library ---
@@ -62,17 +124,21 @@ class FluidSynthApp:
 
     def load_config(self):
         try:
-            with open(os.path.join(self.script_dir, "config.json"), 'r') as f:
-                self.config = json.load(f)
+            self.config = read_json(os.path.join(self.script_dir, "config.json"))
         except Exception as e:
             print(f"ERROR: Failed to load synth config.json: {e}")
             sys.exit(1)
 
     def _init_display(self):
         try:
-            self.display = st7789.ST7789(port=0, cs=1, dc=9, backlight=13, rst=27, width=240, height=240, rotation=90, spi_speed_hz=80000000)
+            self.display = st7789.ST7789(port=0, cs=1, dc=9, backlight=13, rst=27, width=240, height=240, rotation=DISPLAY_ROTATION, spi_speed_hz=80000000)
             self.display.begin()
             self.width, self.height = self.display.width, self.display.height
+            # RGB565 bytes and a scratch plane for _blit, reused by every frame and row update.
+            self._pixbuf = np.empty(self.width * self.height * 2, dtype=np.uint8)
+            self._pixtmp = np.empty(self.width * self.height, dtype=np.uint8)
+            # draw_message can run on gpiozero's thread while run() draws; one _blit at a time.
+            self._blit_lock = threading.Lock()
         except Exception as e:
             print(f"ERROR: Display Init Error: {e}")
             sys.exit(1)
@@ -90,11 +156,10 @@ class FluidSynthApp:
 
     def _init_audio(self):
         try:
-            pygame.init()
             self.fs = fluidsynth.Synth()
             self.fs.start()
             # Set ALSA 'Amp' control to 100% to ensure max system volume headroom
-            os.system("amixer -D default sset Amp 100% > /dev/null 2>&1")
+            self._set_amp_full()
             self.gain = self.config["audio"]["gain"]
             self.fs.setting("synth.gain", self.gain)
             print("FluidSynth: Audio initialized successfully.")
@@ -102,10 +167,22 @@ class FluidSynthApp:
             print(f"ERROR: FluidSynth Audio Init Error: {e}")
             sys.exit(1)
 
+    def _set_amp_full(self):
+        if alsaaudio is not None:
+            try:
+                alsaaudio.Mixer("Amp", device="default").setvolume(100)
+                return
+            except alsaaudio.ALSAAudioError as e:
+                print(f"Warning: Could not set Amp via ALSA: {e}")
+        os.system("amixer -D default sset Amp 100% > /dev/null 2>&1")
+
     def _init_midi(self):
         print("FluidSynth: Initializing MIDI...")
         pygame.midi.init()
         self.midi_in = None
+        self._last_midi_ports = None
+        self._midi_rescans_left = 0
+        self._last_midi_rescan = 0.0
         self.check_midi_connection()
         if self.midi_in:
             print("FluidSynth: MIDI device connected at init.")
@@ -114,15 +191,16 @@ class FluidSynthApp:
 
     def _init_buttons(self):
         try:
-            self.btn_a = Button(BTN_A_PIN, pull_up=True, bounce_time=BOUNCE_TIME)
+            # gpiozero tracks the hold itself; run() just ramps while is_held.
+            self.btn_a = Button(BTN_A_PIN, pull_up=True, bounce_time=BOUNCE_TIME, hold_time=LONG_PRESS_THRESHOLD)
             self.btn_b = Button(BTN_B_PIN, pull_up=True, bounce_time=BOUNCE_TIME)
-            self.btn_x = Button(BTN_X_PIN, pull_up=True, bounce_time=BOUNCE_TIME)
+            self.btn_x = Button(BTN_X_PIN, pull_up=True, bounce_time=BOUNCE_TIME, hold_time=LONG_PRESS_THRESHOLD)
             self.btn_y = Button(BTN_Y_PIN, pull_up=True, bounce_time=BOUNCE_TIME)
             
-            self.btn_a.when_pressed = lambda: self.record_press('a')
-            self.btn_a.when_released = lambda: self.handle_release('a')
-            self.btn_x.when_pressed = lambda: self.record_press('x')
-            self.btn_x.when_released = lambda: self.handle_release('x')
+            self.btn_a.when_pressed = functools.partial(self.record_press, BTN_A_IDX)
+            self.btn_a.when_released = functools.partial(self.handle_release, BTN_A_IDX)
+            self.btn_x.when_pressed = functools.partial(self.record_press, BTN_X_IDX)
+            self.btn_x.when_released = functools.partial(self.handle_release, BTN_X_IDX)
             
             self.btn_b.when_pressed = self.load_selected_soundfont
             self.btn_y.when_pressed = self.return_to_menu
@@ -130,17 +208,16 @@ class FluidSynthApp:
             print(f"ERROR: Button Init Error: {e}")
             sys.exit(1)
 
-    def record_press(self, btn_char):
-        self.press_times[btn_char] = time.time()
+    def record_press(self, btn_idx):
+        self.press_times[btn_idx] = time.time()
 
-    def handle_release(self, btn_char):
-        LONG_PRESS_THRESHOLD = 0.3 
-        duration = time.time() - self.press_times.get(btn_char, time.time())
+    def handle_release(self, btn_idx):
+        duration = time.time() - self.press_times[btn_idx]
         
         if duration < LONG_PRESS_THRESHOLD:
-            if btn_char == 'a':
+            if btn_idx == BTN_A_IDX:
                 self.navigate_sf(-1)
-            elif btn_char == 'x':
+            elif btn_idx == BTN_X_IDX:
                 self.navigate_sf(1)
         
     def load_selected_soundfont(self):
@@ -157,10 +234,23 @@ class FluidSynthApp:
                 print("MIDI keyboard disconnected.")
                 self.midi_in.close()
                 self.midi_in = None
+                self._last_midi_ports = None
                 self.needs_redraw = True
 
-        # If not connected, try to connect
+        # If not connected, try to connect. PortMidi only sees new devices after
+        # quit/init, so rescan when the kernel's MIDI device nodes change, for a
+        # few checks after that, and otherwise every MIDI_RESCAN_INTERVAL.
         if self.midi_in is None:
+            ports = self._midi_ports()
+            now = time.time()
+            if ports is None or ports != self._last_midi_ports:
+                self._last_midi_ports = ports
+                self._midi_rescans_left = MIDI_SETTLE_RESCANS
+            elif self._midi_rescans_left == 0 and now - self._last_midi_rescan < MIDI_RESCAN_INTERVAL:
+                return
+            if self._midi_rescans_left:
+                self._midi_rescans_left -= 1
+            self._last_midi_rescan = now
             pygame.midi.quit()
             pygame.midi.init()
             if pygame.midi.get_count() > 0:
@@ -187,6 +277,13 @@ class FluidSynthApp:
                         time.sleep(3) # Show error for a moment
                         self.needs_redraw = True
     
+    def _midi_ports(self):
+        """The ALSA MIDI device nodes present, or None if /dev/snd can't be read."""
+        try:
+            return frozenset(name for name in os.listdir("/dev/snd") if name.startswith("midi"))
+        except OSError:
+            return None
+
     def get_library_path(self):
         return os.path.join(self.root_dir, self.config["paths"]["library_file"])
 
@@ -194,8 +291,9 @@ class FluidSynthApp:
         path = self.get_library_path()
         if not os.path.exists(path): return False
         try:
-            with open(path, 'r') as f: data = json.load(f)
+            data = read_json(path)
             self.soundfonts = data.get("soundfonts", [])
+            self._update_sf_names()
             self.sf_selection = data.get("last_selection", 0)
             self.gain = data.get("last_gain", self.config["audio"]["gain"])
             self.fs.setting("synth.gain", self.gain)
@@ -212,32 +310,70 @@ class FluidSynthApp:
             "last_gain": self.gain
         }
         try:
-            with open(path, 'w') as f: json.dump(data, f)
+            write_json(path, data)
         except Exception as e: print(f"Error saving synth library: {e}")
         
     def scan_for_soundfonts(self):
         sf_dir = os.path.expanduser(self.config["paths"]["soundfont_dir"])
         print(f"Scanning for SoundFonts in {sf_dir}...")
         self.soundfonts = sorted(glob.glob(os.path.join(sf_dir, "*.sf2")))
+        self._update_sf_names()
         self.sf_selection = 0
         self.save_library()
         self.needs_redraw = True
 
+    def _update_sf_names(self):
+        """List labels for self.soundfonts, truncated to fit the display once."""
+        names = (os.path.basename(path) for path in self.soundfonts)
+        self._sf_names = [name if len(name) <= 22 else name[:21] + ".." for name in names]
+
     def load_soundfont(self, path):
         if not os.path.exists(path):
             print(f"SoundFont not found: {path}")
             self.draw_message("SoundFont not found!", os.path.basename(path), "red")
             return
         
+        if path == self._sf_requested_path:
+            return  # already loaded or on its way
+        
         print(f"Loading {os.path.basename(path)}")
         self.draw_message("Loading...", os.path.basename(path))
-        
-        if hasattr(self, 'sfid'):
-            self.fs.sfunload(self.sfid)
-
-        self.sfid = self.fs.sfload(path)
-        self.fs.program_select(0, self.sfid, 0, 0)
-        self.needs_redraw = True
+        # sfload runs on the loader thread so this button callback returns at once.
+        # fluidsynth holds its API lock for the whole load, so note input from
+        # run() still pauses until it finishes; the old soundfont stays selected.
+        self._sf_requested_path = path
+        self._sf_generation += 1
+        self._sf_requests.put((self._sf_generation, path))
+
+    def _sf_loader(self):
+        while True:
+            generation, path = self._sf_requests.get()
+            # Only the newest queued request is worth loading.
+            while not self._sf_requests.empty():
+                generation, path = self._sf_requests.get()
+            if generation != self._sf_generation:
+                continue
+            self._loaded_sfs.put((generation, path, self.fs.sfload(path)))
+
+    def swap_loaded_soundfonts(self):
+        """Selects the soundfont _sf_loader finished for the latest request and unloads the one it replaces."""
+        while not self._loaded_sfs.empty():
+            generation, path, sfid = self._loaded_sfs.get()
+            if generation != self._sf_generation:
+                if sfid != -1:
+                    self.fs.sfunload(sfid)
+                continue
+            if sfid == -1:
+                print(f"Failed to load {os.path.basename(path)}")
+                self._sf_requested_path = self._sf_path
+                self.draw_message("Load failed!", os.path.basename(path), "red")
+                self._message_until = time.time() + 2  # hold it without stalling MIDI
+            else:
+                self.fs.program_select(0, sfid, 0, 0)
+                if hasattr(self, 'sfid'):
+                    self.fs.sfunload(self.sfid)
+                self.sfid, self._sf_path = sfid, path
+            self.needs_redraw = True
 
     def navigate_sf(self, direction):
         if not self.soundfonts: return
@@ -252,70 +388,148 @@ class FluidSynthApp:
         self.fs.setting("synth.gain", self.gain)
         self.needs_redraw = True
 
-    def draw_ui(self):
+    def _render_frame(self, midi_connected):
+        """Starts a frame with the title bar and the MIDI status line."""
         img = Image.new("RGB", (self.width, self.height), "black")
         draw = ImageDraw.Draw(img)
-        
+
         draw.text((10, 5), "MIDI SYNTH", font=self.font_lg, fill="cyan")
-        draw.line((10, 35, self.width - 10, 35), fill="cyan", width=1)
+        img.paste((0, 255, 255), (10, 35, self.width - 9, 36))  # separator: a plain fill, not a line
 
-        if self.midi_in is None:
-            message_line1 = "Waiting for"
-            message_line2 = "MIDI Keyboard..."
-            
-            w1 = draw.textlength(message_line1, font=self.font_lg)
-            w2 = draw.textlength(message_line2, font=self.font_lg)
-            
-            x1 = (self.width - w1) // 2
-            x2 = (self.width - w2) // 2
-            
-            draw.text((x1, 100), message_line1, font=self.font_lg, fill="yellow")
-            draw.text((x2, 130), message_line2, font=self.font_lg, fill="yellow")
+        midi_status = "MIDI: CONNECTED" if midi_connected else "MIDI: NOT FOUND"
+        midi_color = "lime" if midi_connected else "orange"
+        draw.text((10, self.height - 25), midi_status, font=self.font_md, fill=midi_color)
+        return img, draw
 
-        elif not self.soundfonts:
-            draw.text((20, 100), "No SoundFonts found!", font=self.font_md, fill="red")
+    def _render_waiting_midi(self):
+        img, draw = self._render_frame(False)
+        message_line1 = "Waiting for"
+        message_line2 = "MIDI Keyboard..."
 
+        w1 = text_width(self.font_lg, message_line1)
+        w2 = text_width(self.font_lg, message_line2)
+
+        x1 = (self.width - w1) // 2
+        x2 = (self.width - w2) // 2
+
+        draw.text((x1, 100), message_line1, font=self.font_lg, fill="yellow")
+        draw.text((x2, 130), message_line2, font=self.font_lg, fill="yellow")
+        return img
+
+    def _render_no_sf(self):
+        img, draw = self._render_frame(True)
+        draw.text((20, 100), "No SoundFonts found!", font=self.font_md, fill="red")
+        return img
+
+    def render_list_row(self, label, selected):
+        """Rasterizes one soundfont row; cached through self.list_row in __init__."""
+        row = Image.new("RGB", (self.width, 23), "cyan" if selected else "black")
+        ImageDraw.Draw(row).text((10, 0), label, font=self.font_md, fill="black" if selected else "white")
+        return row
+
+    def draw_ui(self):
+        # Skip redraws that would send the same pixels, e.g. a gain ramp pinned at its limit.
+        state = (self.midi_in is not None, self.sf_selection, int(self.gain * 100), len(self.soundfonts))
+        if state == self._last_state:
+            return
+        last_state, self._last_state = self._last_state, state
+        rows = None
+
+        # Every screen starts from a frame rendered once in __init__; the waiting
+        # screens only get the gain stamped on top.
+        img, draw = self._canvas, self._draw
+        if self.midi_in is None:
+            img.paste(self._waiting_midi_img)
+        elif not self.soundfonts:
+            img.paste(self._no_sf_img)
         else:
+            img.paste(self._list_img)
             y, h = 45, 22
             start_idx = max(0, self.sf_selection - 3)
-            visible_sfs = self.soundfonts[start_idx:start_idx + 7]
-
-            for i, sf_path in enumerate(visible_sfs):
-                real_idx = start_idx + i
-                name = os.path.basename(sf_path)
-                if len(name) > 22: name = name[:21] + ".."
-                
-                color = "white"
-                if real_idx == self.sf_selection:
-                    draw.rectangle((0, y, self.width, y + h), fill="cyan")
-                    color = "black"
-
-                draw.text((10, y), f"{'> ' if real_idx == self.sf_selection else '  '}{name}", font=self.font_md, fill=color)
+            visible_names = self._sf_names[start_idx:start_idx + 7]
+            rows = []
+
+            for i, name in enumerate(visible_names):
+                selected = start_idx + i == self.sf_selection
+                label = f"{'> ' if selected else '  '}{name}"
+                img.paste(self.list_row(label, selected), (0, y))
+                rows.append(label)
                 y += h + 2
         
-        midi_status = "MIDI: CONNECTED" if self.midi_in else "MIDI: NOT FOUND"
-        midi_color = "lime" if self.midi_in else "orange"
-        draw.text((10, self.height - 25), midi_status, font=self.font_md, fill=midi_color)
-        
         gain_text = f"Gain: {int(self.gain * 100)}%"
-        w = draw.textlength(gain_text, font=self.font_md)
+        w = text_width(self.font_md, gain_text)
         draw.text((self.width - w - 10, self.height - 25), gain_text, font=self.font_md, fill="white")
-        
-        self.display.display(img)
+
+        # A selection move with nothing else changed only repaints the list rows
+        # whose text differs, usually just the old and new highlight.
+        prev_rows, self._list_rows = self._list_rows, rows
+        if (last_state is not None and rows and prev_rows and len(rows) == len(prev_rows)
+                and last_state[0] == state[0] and last_state[2:] == state[2:]):
+            for i, (row, prev) in enumerate(zip(rows, prev_rows)):
+                if row != prev:
+                    self._blit(img, (0, 45 + 24 * i, self.width, 68 + 24 * i))
+            return
+        self._blit(img)
+
+    def _panel_window(self, x0, y0, x1, y1):
+        """Maps a frame rectangle to the panel window it occupies after rotation."""
+        w, h = self.width - 1, self.height - 1
+        if DISPLAY_ROTATION == 90:
+            return y0, w - x1, y1, w - x0
+        if DISPLAY_ROTATION == 180:
+            return w - x1, h - y1, w - x0, h - y0
+        if DISPLAY_ROTATION == 270:
+            return h - y1, x0, h - y0, x1
+        return x0, y0, x1, y1
+
+    def _blit(self, img, box=None):
+        """Packs a full-screen RGB image, or one (left, upper, right, lower) box of it,
+        into panel RGB565 with NumPy and streams it to the display."""
+        if box is None:
+            box = (0, 0, self.width, self.height)
+        else:
+            img = img.crop(box)
+        arr = np.rot90(np.asarray(img), DISPLAY_ROTATION // 90)
+        with self._blit_lock:
+            self._send_rgb565(arr, box)
+
+    def _send_rgb565(self, arr, box):
+        size = arr.shape[0] * arr.shape[1]
+        out = self._pixbuf[:2 * size].reshape(arr.shape[0], arr.shape[1], 2)
+        tmp = self._pixtmp[:size].reshape(arr.shape[:2])
+        r, g, b = arr[..., 0], arr[..., 1], arr[..., 2]
+        hi, lo = out[..., 0], out[..., 1]
+        # Big-endian RGB565 written a byte at a time (RRRRRGGG GGGBBBBB), so
+        # every pass stays 8-bit and no byteswap is needed.
+        np.bitwise_and(r, 0xF8, out=hi)
+        np.right_shift(g, 5, out=tmp)
+        hi |= tmp
+        np.left_shift(g, 3, out=lo)
+        lo &= 0xE0
+        np.right_shift(b, 3, out=tmp)
+        lo |= tmp
+        self.display.set_window(*self._panel_window(box[0], box[1], box[2] - 1, box[3] - 1))
+        self.display.send([], True)  # raise D/C for data
+        self.display._spi.writebytes2(memoryview(out).cast("B"))
 
     def draw_message(self, line1, line2, color="cyan"):
         img = Image.new("RGB", (self.width, self.height), "black")
         draw = ImageDraw.Draw(img)
         draw.text((20, 90), line1, font=self.font_lg, fill=color)
         draw.text((20, 120), line2, font=self.font_md, fill="white")
-        self.display.display(img)
+        self._blit(img)
+        # The UI is no longer on screen; the next draw_ui repaints all of it.
+        self._last_state = None
+        self._list_rows = None
 
     def return_to_menu(self):
         print("Returning to Main Menu...")
+        self.display.set_backlight(0)
         self.save_library()
-        self.fs.delete()
+        # delete() can block while the audio driver drains; exec doesn't wait for
+        # it, and the kernel closes the audio device when the process image goes.
+        threading.Thread(target=self.fs.delete, daemon=True).start()
         pygame.midi.quit()
-        self.display.set_backlight(0)
         
         menu_script = os.path.abspath(os.path.join(self.script_dir, '..', 'Start.py'))
         os.execv(sys.executable, [sys.executable, menu_script])
@@ -323,38 +537,41 @@ class FluidSynthApp:
     def run(self):
         print("FluidSynth App Running...")
         last_midi_check_time = time.time()
-        LONG_PRESS_THRESHOLD = 0.3 
+        # Call libfluidsynth directly in the note loop; Synth.noteon/noteoff only
+        # add range checks that MIDI data bytes (0-127) always pass.
+        noteon, noteoff, synth = fluidsynth.fluid_synth_noteon, fluidsynth.fluid_synth_noteoff, self.fs.synth
+        NOTE_ON, NOTE_OFF = 0x90, 0x80
 
         try:
             while True:
                 try:
                     current_time = time.time()
 
-                    # Handle continuous long press for volume
-                    if self.btn_a.is_active and (current_time - self.press_times.get('a', current_time) > LONG_PRESS_THRESHOLD):
-                        if int(current_time * 10) % 2 == 0: self.change_gain(-0.02)
-                    if self.btn_x.is_active and (current_time - self.press_times.get('x', current_time) > LONG_PRESS_THRESHOLD):
-                        if int(current_time * 10) % 2 == 0: self.change_gain(0.02)
+                    # Handle continuous long press for volume; 0.02 per 20 ms tick keeps the old ramp rate
+                    if self.btn_a.is_held: self.change_gain(-0.02)
+                    if self.btn_x.is_held: self.change_gain(0.02)
 
                     # Periodically check for MIDI connection changes
                     if current_time - last_midi_check_time > 1.0:
                         self.check_midi_connection()
                         last_midi_check_time = current_time
 
-                    # Process MIDI events if a device is connected
-                    if self.midi_in and self.midi_in.poll():
-                        for event in self.midi_in.read(16):
+                    # Drain every pending MIDI event per wake so chord bursts don't wait a tick
+                    while self.midi_in and self.midi_in.poll():
+                        for event in self.midi_in.read(64):
                             (status, note, vel, _), _ = event
-                            if status == 0x90 and vel > 0: # Note On
-                                self.fs.noteon(0, note, vel)
-                            elif status == 0x80 or (status == 0x90 and vel == 0): # Note Off
-                                self.fs.noteoff(0, note)
+                            if status == NOTE_ON and vel > 0:
+                                noteon(synth, 0, note, vel)
+                            elif status == NOTE_OFF or (status == NOTE_ON and vel == 0):
+                                noteoff(synth, 0, note)
+
+                    self.swap_loaded_soundfonts()
 
-                    if self.needs_redraw:
+                    if self.needs_redraw and current_time >= self._message_until:
                         self.draw_ui()
                         self.needs_redraw = False
                     
-                    time.sleep(0.01)
+                    time.sleep(0.02)
 
                 except Exception as e:
                     print(f"---!!! UNEXPECTED RUNTIME ERROR !!!---")